@@ -15,6 +15,7 @@ import {
 	EpistleRegistry,
 	EpistleRegistryEntry,
 	createEpistleRegistry,
+	invalidateRegistryCache,
 } from './epistleRegistry';
 import {
 	LetterEpistleGenerator,
@@ -88,6 +89,405 @@ describe('Epistle System', () => {
 			assert.strictEqual(registry2.getAllEntries().length, 1);
 			assert.deepStrictEqual(registry2.getEntry('epistle-001'), entry);
 		});
+
+		it('should expose the epistles directory alongside the registry file', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(registry.getEpistlesDir(), workspace.getEpistlesDir());
+			assert.strictEqual(path.dirname(registry.getRegistryPath()), registry.getEpistlesDir());
+		});
+
+		it('should serve unchanged registry from cache without re-reading', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({
+				id: 'epistle-001',
+				type: 'letter',
+				date: '2025-10-28',
+				personas: ['dev-guide'],
+			});
+
+			// Patch the real module object (the `import * as` namespace is read-only)
+			const realFs = require('fs');
+			const originalRead = realFs.readFileSync;
+			const originalParse = JSON.parse;
+			let reads = 0;
+			let parses = 0;
+			realFs.readFileSync = (...args: any[]) => {
+				reads++;
+				return originalRead(...args);
+			};
+			JSON.parse = (...args: Parameters<typeof JSON.parse>) => {
+				parses++;
+				return originalParse(...args);
+			};
+			try {
+				const registry2 = createEpistleRegistry(workspace.getRootPath());
+				assert.strictEqual(registry2.getAllEntries().length, 1);
+				// A hit shares the cached entries: no re-parse, no copy
+				assert.strictEqual(registry2.getEntry('epistle-001'), registry.getEntry('epistle-001'));
+			} finally {
+				realFs.readFileSync = originalRead;
+				JSON.parse = originalParse;
+			}
+			assert.strictEqual(reads, 0);
+			assert.strictEqual(parses, 0);
+		});
+
+		it('should fold search fields once per registry version, not per instance', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({
+				id: 'epistle-001',
+				type: 'letter',
+				date: '2025-10-28',
+				personas: ['Dev-Guide'],
+				topic: 'Error Handling',
+				keywords: ['Retry'],
+			});
+			assert.strictEqual(registry.search('retry').length, 1);
+
+			const originalLower = String.prototype.toLowerCase;
+			let lowered = 0;
+			String.prototype.toLowerCase = function (this: string) {
+				lowered++;
+				return originalLower.call(this);
+			};
+			try {
+				const registry2 = createEpistleRegistry(workspace.getRootPath());
+				assert.strictEqual(registry2.search('RETRY').length, 1);
+				registry2.reload();
+				assert.strictEqual(registry2.search('Handling').length, 1);
+			} finally {
+				String.prototype.toLowerCase = originalLower;
+			}
+			// Only the two queries themselves
+			assert.strictEqual(lowered, 2);
+		});
+
+		it('should reload when the registry file changes on disk', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(registry.getAllEntries().length, 0);
+
+			const extra = { id: 'external-001', type: 'inline', date: '2025-10-28', personas: ['qa'] };
+			fs.writeFileSync(registry.getRegistryPath(), JSON.stringify(extra));
+
+			registry.reload();
+			assert.strictEqual(registry.getEntry('external-001')?.personas[0], 'qa');
+		});
+
+		it('should not leave blank lines when appending after a trailing newline', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			const extra = { id: 'external-001', type: 'inline', date: '2025-10-28', personas: ['qa'] };
+			fs.writeFileSync(registry.getRegistryPath(), JSON.stringify(extra) + '\n');
+
+			registry.addEntry({ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: ['dev-guide'] });
+
+			const lines = fs.readFileSync(registry.getRegistryPath(), 'utf-8').split('\n');
+			assert.deepStrictEqual(
+				lines.map(line => JSON.parse(line).id),
+				['external-001', 'epistle-001']
+			);
+		});
+
+		it('should not leak caller mutations into the shared cache', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			const entry: EpistleRegistryEntry = {
+				id: 'epistle-001',
+				type: 'letter',
+				date: '2025-10-28',
+				personas: ['dev-guide'],
+				topic: 'Original',
+			};
+			registry.addEntry(entry);
+
+			// The caller's object stays theirs; the registry keeps its own copy
+			entry.personas.push('leaked');
+			assert.deepStrictEqual(registry.getEntry('epistle-001')?.personas, ['dev-guide']);
+
+			// Stored entries are frozen, nested arrays included
+			assert.throws(() => {
+				registry.getEntry('epistle-001')!.topic = 'Mutated';
+			}, TypeError);
+			assert.throws(() => registry.getEntry('epistle-001')!.personas.push('leaked'), TypeError);
+
+			invalidateRegistryCache();
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+			assert.throws(() => reloaded.getEntry('epistle-001')!.personas.push('leaked'), TypeError);
+			assert.strictEqual(reloaded.getEntry('epistle-001')?.topic, 'Original');
+		});
+
+		it('should append new entries without rewriting existing lines', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: [] });
+			const before = fs.readFileSync(registry.getRegistryPath(), 'utf-8');
+
+			registry.addEntry({ id: 'epistle-002', type: 'letter', date: '2025-10-28', personas: [] });
+			const after = fs.readFileSync(registry.getRegistryPath(), 'utf-8');
+
+			assert.ok(after.startsWith(before));
+			assert.strictEqual(after.split('\n').length, 2);
+		});
+
+		it('should fold appended updates and compact them away', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({
+				id: 'epistle-001',
+				type: 'letter',
+				date: '2025-10-28',
+				personas: ['dev-guide'],
+				status: 'draft',
+			});
+			registry.updateEntry('epistle-001', { status: 'resolved' });
+
+			invalidateRegistryCache();
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(reloaded.getAllEntries().length, 1);
+			assert.strictEqual(reloaded.getEntry('epistle-001')?.status, 'resolved');
+
+			reloaded.compact();
+			const lines = fs.readFileSync(reloaded.getRegistryPath(), 'utf-8').split('\n');
+			assert.strictEqual(lines.length, 1);
+			assert.strictEqual(JSON.parse(lines[0]).status, 'resolved');
+		});
+
+		it('should compact on its own once superseded lines pile up', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: [] });
+			for (let i = 0; i < 100; i++) {
+				registry.updateEntry('epistle-001', { topic: `Revision ${i}` });
+			}
+
+			const lines = fs.readFileSync(registry.getRegistryPath(), 'utf-8').split('\n');
+			assert.ok(lines.length < 100, `expected compaction, found ${lines.length} lines`);
+
+			invalidateRegistryCache();
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(reloaded.getEntry('epistle-001')?.topic, 'Revision 99');
+		});
+
+		it('should compact a bloated registry when loading it', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			const lines = [];
+			for (let i = 0; i < 100; i++) {
+				lines.push(JSON.stringify({ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: [], topic: `Revision ${i}` }));
+			}
+			fs.writeFileSync(registryPath, lines.join('\n'));
+
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(registry.getEntry('epistle-001')?.topic, 'Revision 99');
+			assert.strictEqual(fs.readFileSync(registryPath, 'utf-8').split('\n').length, 1);
+		});
+
+		it('should append to a registry written by another process', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			fs.writeFileSync(
+				registryPath,
+				JSON.stringify({ id: 'external-001', type: 'letter', date: '2025-10-28', personas: [] }) + '\n'
+			);
+
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: [] });
+
+			invalidateRegistryCache();
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+			assert.deepStrictEqual(
+				reloaded.getAllEntries().map(e => e.id),
+				['external-001', 'epistle-001']
+			);
+		});
+
+		it('should skip malformed lines and keep the rest', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			fs.writeFileSync(
+				registryPath,
+				[
+					JSON.stringify({ id: 'good-001', type: 'letter', date: '2025-10-28', personas: [] }),
+					'{not json',
+					JSON.stringify({ id: 'good-002', type: 'inline', date: '2025-10-28', personas: [] }),
+				].join('\n')
+			);
+
+			const originalError = console.error;
+			console.error = () => {};
+			try {
+				const registry = createEpistleRegistry(workspace.getRootPath());
+				assert.deepStrictEqual(
+					registry.getAllEntries().map(e => e.id),
+					['good-001', 'good-002']
+				);
+			} finally {
+				console.error = originalError;
+			}
+		});
+
+		it('should ignore blank and whitespace-only lines', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			fs.writeFileSync(
+				registryPath,
+				'\n' +
+					JSON.stringify({ id: 'good-001', type: 'letter', date: '2025-10-28', personas: [] }) +
+					'\r\n   \n\t\n' +
+					JSON.stringify({ id: 'good-002', type: 'inline', date: '2025-10-28', personas: [] }) +
+					'\n\n'
+			);
+
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			assert.deepStrictEqual(
+				registry.getAllEntries().map(e => e.id),
+				['good-001', 'good-002']
+			);
+		});
+
+		it('should load large registries with blank and malformed lines', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			const lines: string[] = [];
+			for (let i = 0; i < 3000; i++) {
+				lines.push(
+					JSON.stringify({
+						id: `epistle-${i}`,
+						type: 'letter',
+						date: '2025-10-28',
+						personas: ['dev-guide'],
+						topic: `Topic ${i}, with commas, "quotes" and ↔ unicode`,
+					})
+				);
+				if (i % 500 === 0) {
+					lines.push('   \r');
+				}
+			}
+			fs.writeFileSync(registryPath, lines.join('\r\n') + '\n');
+			assert.ok(fs.statSync(registryPath).size > 256 * 1024);
+
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(registry.getAllEntries().length, 3000);
+			assert.strictEqual(
+				registry.getEntry('epistle-2999')?.topic,
+				'Topic 2999, with commas, "quotes" and ↔ unicode'
+			);
+
+			// A malformed line forces the line-by-line fallback
+			fs.appendFileSync(registryPath, '{broken\n');
+			invalidateRegistryCache();
+			const originalError = console.error;
+			console.error = () => {};
+			try {
+				const reloaded = createEpistleRegistry(workspace.getRootPath());
+				assert.strictEqual(reloaded.getAllEntries().length, 3000);
+			} finally {
+				console.error = originalError;
+			}
+		});
+
+		it('should skip lines that are valid JSON but not records', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			fs.writeFileSync(
+				registryPath,
+				[
+					JSON.stringify({ id: 'x1', type: 'letter', date: '2025-10-28', personas: [] }),
+					'null',
+					'42',
+					'"str"',
+					JSON.stringify({ id: 'x2', type: 'letter', date: '2025-10-28', personas: [] }),
+				].join('\n')
+			);
+
+			const originalError = console.error;
+			console.error = () => {};
+			try {
+				const registry = createEpistleRegistry(workspace.getRootPath());
+				assert.deepStrictEqual(registry.getAllEntries().map(e => e.id), ['x1', 'x2']);
+			} finally {
+				console.error = originalError;
+			}
+		});
+
+		it('should index records with wrong-typed fields without breaking search', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			fs.writeFileSync(
+				registryPath,
+				[
+					JSON.stringify({ id: 'odd-001', type: 'letter', date: '2025-10-28', personas: 'a', topic: 42 }),
+					JSON.stringify({ id: 'odd-002', type: 'letter', date: '2025-10-28', personas: [1, 'QA'], keywords: 'x' }),
+					JSON.stringify({ id: 'good-001', type: 'letter', date: '2025-10-28', personas: [], topic: 'Retry' }),
+				].join('\n')
+			);
+
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(registry.getAllEntries().length, 3);
+			assert.deepStrictEqual(registry.search('retry').map(e => e.id), ['good-001']);
+			assert.deepStrictEqual(registry.query({ personas: ['qa'] }).map(e => e.id), ['odd-002']);
+		});
+
+		it('should not accept several values packed onto one line', () => {
+			const registryPath = path.join(workspace.getEpistlesDir(), 'registry.ndjson');
+			fs.writeFileSync(
+				registryPath,
+				[
+					JSON.stringify({ id: 'good-001', type: 'letter', date: '2025-10-28', personas: [] }),
+					'{"id":"a","type":"letter"},{"id":"b","type":"letter"}',
+				].join('\n')
+			);
+
+			const originalError = console.error;
+			console.error = () => {};
+			try {
+				const registry = createEpistleRegistry(workspace.getRootPath());
+				assert.deepStrictEqual(registry.getAllEntries().map(e => e.id), ['good-001']);
+			} finally {
+				console.error = originalError;
+			}
+		});
+
+		it('should re-read after the cache is invalidated', () => {
+			const registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntry({ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: [] });
+
+			invalidateRegistryCache();
+			const registry2 = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(registry2.getEntry('epistle-001')?.id, 'epistle-001');
+		});
+	});
+
+	describe('Registry: Batch Writes', () => {
+		let workspace: TempWorkspace;
+		let registry: EpistleRegistry;
+
+		beforeEach(() => {
+			workspace = new TempWorkspace();
+			registry = createEpistleRegistry(workspace.getRootPath());
+		});
+
+		afterEach(() => {
+			workspace.cleanup();
+		});
+
+		function countAppends(fn: () => void): number {
+			const realFs = require('fs');
+			const originalAppend = realFs.appendFileSync;
+			let appends = 0;
+			realFs.appendFileSync = (...args: any[]) => {
+				appends++;
+				return originalAppend(...args);
+			};
+			try {
+				fn();
+			} finally {
+				realFs.appendFileSync = originalAppend;
+			}
+			return appends;
+		}
+
+		it('should write all entries from addEntries at once', () => {
+			const appends = countAppends(() =>
+				registry.addEntries([
+					{ id: 'epistle-001', type: 'letter', date: '2025-10-28', personas: [] },
+					{ id: 'epistle-002', type: 'letter', date: '2025-10-28', personas: [] },
+					{ id: 'epistle-003', type: 'inline', date: '2025-10-28', personas: [] },
+				])
+			);
+
+			assert.strictEqual(appends, 1);
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(reloaded.getAllEntries().length, 3);
+		});
 	});
 
 	describe('Registry: Query and Filter', () => {
@@ -154,6 +554,100 @@ describe('Epistle System', () => {
 			assert.strictEqual(inlineInExt.length, 1);
 		});
 
+		it('should find dynamic persona by source file', () => {
+			assert.strictEqual(
+				registry.getDynamicPersonaForFile('src/parser.ts')?.id,
+				'persona-parser'
+			);
+			assert.strictEqual(registry.getDynamicPersonaForFile('src/other.ts'), undefined);
+		});
+
+		it('should keep the first registered persona for a file after it is updated', () => {
+			registry.addEntry({
+				id: 'persona-parser-2',
+				type: 'dynamic_persona',
+				date: '2025-10-28',
+				personas: ['parser-critic'],
+				source_file: 'src/parser.ts',
+				name: 'parser-critic',
+				created_at: new Date().toISOString(),
+			});
+
+			registry.updateEntry('persona-parser', { name: 'parser-champion' });
+
+			assert.strictEqual(registry.getDynamicPersonaForFile('src/parser.ts')?.id, 'persona-parser');
+			assert.strictEqual(
+				createEpistleRegistry(workspace.getRootPath()).getDynamicPersonaForFile('src/parser.ts')?.id,
+				'persona-parser'
+			);
+		});
+
+		it('should keep file lookups in step with updates and reloads', () => {
+			registry.updateEntry('inline-001', { inline_file: 'src/moved.ts' });
+
+			assert.strictEqual(registry.getInlineEpistlesInFile('src/extension.ts').length, 0);
+			assert.strictEqual(registry.getInlineEpistlesInFile('src/moved.ts')[0].id, 'inline-001');
+
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+			assert.strictEqual(reloaded.getInlineEpistlesInFile('src/moved.ts')[0].id, 'inline-001');
+			assert.strictEqual(reloaded.getDynamicPersonaForFile('src/parser.ts')?.id, 'persona-parser');
+		});
+
+		it('should search topic, keywords, and context case-insensitively', () => {
+			registry.updateEntry('inline-001', { keywords: ['Naming'], context: ['SRC/Extension.ts'] });
+
+			assert.deepStrictEqual(registry.search('ERROR').map(e => e.id), ['epistle-001']);
+			assert.deepStrictEqual(registry.search('naming').map(e => e.id), ['inline-001']);
+			assert.deepStrictEqual(registry.search('extension').map(e => e.id), ['inline-001']);
+			assert.strictEqual(registry.search('nothing-matches').length, 0);
+		});
+
+		it('should reflect updates in search results', () => {
+			registry.updateEntry('epistle-001', { topic: 'Retry policy' });
+
+			assert.strictEqual(registry.search('error').length, 0);
+			assert.deepStrictEqual(registry.search('retry').map(e => e.id), ['epistle-001']);
+		});
+
+		it('should yield matching entries lazily', () => {
+			const seen: string[] = [];
+			const iterator = registry.entriesWhere(e => {
+				seen.push(e.id);
+				return e.personas.includes('dev-guide');
+			});
+
+			assert.strictEqual(iterator.next().value?.id, 'epistle-001');
+			assert.deepStrictEqual(seen, ['epistle-001']);
+		});
+
+		it('should add context files without duplicates', () => {
+			registry.updateEntry('epistle-001', { context: ['src/a.ts'] });
+
+			const added = registry.addContext('epistle-001', ['src/a.ts', 'src/b.ts', 'src/b.ts', 'src/c.ts']);
+
+			assert.strictEqual(added, 2);
+			assert.deepStrictEqual(registry.getEntry('epistle-001')?.context, ['src/a.ts', 'src/b.ts', 'src/c.ts']);
+			assert.deepStrictEqual(registry.search('src/c.ts').map(e => e.id), ['epistle-001']);
+			assert.strictEqual(registry.addContext('epistle-001', ['src/a.ts']), 0);
+			assert.strictEqual(registry.addContext('missing', ['src/a.ts']), 0);
+		});
+
+		it('should add context to entries whose context on disk is not an array', () => {
+			fs.writeFileSync(
+				registry.getRegistryPath(),
+				[
+					JSON.stringify({ id: 'odd-001', type: 'letter', date: '2025-10-28', personas: [], context: 7 }),
+					JSON.stringify({ id: 'odd-002', type: 'letter', date: '2025-10-28', personas: [], context: 'src/a.ts' }),
+				].join('\n')
+			);
+			const reloaded = createEpistleRegistry(workspace.getRootPath());
+
+			assert.strictEqual(reloaded.addContext('odd-001', ['src/b.ts']), 1);
+			assert.deepStrictEqual(reloaded.getEntry('odd-001')?.context, ['src/b.ts']);
+			assert.strictEqual(reloaded.addContext('odd-002', ['src/b.ts']), 1);
+			assert.deepStrictEqual(reloaded.getEntry('odd-002')?.context, ['src/b.ts']);
+		});
+
 		it('should get dynamic personas', () => {
 			const personas = registry.getDynamicPersonas();
 			assert.strictEqual(personas.length, 1);
@@ -161,6 +655,145 @@ describe('Epistle System', () => {
 		});
 	});
 
+	describe('Registry: Structured Query', () => {
+		let registry: EpistleRegistry;
+		let workspace: TempWorkspace;
+
+		beforeEach(() => {
+			workspace = new TempWorkspace();
+			registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntries([
+				{
+					id: 'epistle-001',
+					type: 'letter',
+					date: '2025-10-28',
+					personas: ['dev-guide', 'Code-Reviewer'],
+					topic: 'Error handling strategy',
+					keywords: ['errors', 'retry'],
+				},
+				{
+					id: 'epistle-002',
+					type: 'letter',
+					date: '2025-10-29',
+					personas: ['dev-guide'],
+					topic: 'Async boundaries',
+					keywords: ['async'],
+				},
+				{
+					id: 'epistle-003',
+					type: 'letter',
+					date: '2025-10-30',
+					personas: ['qa-lead'],
+					topic: 'Retry handling in tests',
+					keywords: ['retry', 'tests'],
+				},
+			]);
+		});
+
+		afterEach(() => {
+			workspace.cleanup();
+		});
+
+		it('should return everything with no filters', () => {
+			assert.strictEqual(registry.query({}).length, 3);
+		});
+
+		it('should match any of the given personas, ignoring case', () => {
+			const ids = registry.query({ personas: ['code-reviewer', 'QA-LEAD'] }).map(e => e.id);
+			assert.deepStrictEqual(ids.sort(), ['epistle-001', 'epistle-003']);
+		});
+
+		it('should match whole topic words, then the phrase', () => {
+			const ids = registry.query({ topic: 'HANDLING' }).map(e => e.id);
+			assert.deepStrictEqual(ids.sort(), ['epistle-001', 'epistle-003']);
+
+			assert.deepStrictEqual(
+				registry.query({ topic: 'error handling' }).map(e => e.id),
+				['epistle-001']
+			);
+
+			// Both words are indexed for epistle-003, but not as this phrase
+			assert.strictEqual(registry.query({ topic: 'handling retry' }).length, 0);
+			assert.strictEqual(registry.query({ topic: 'hand' }).length, 0);
+		});
+
+		it('should intersect filters', () => {
+			const ids = registry
+				.query({ personas: ['dev-guide'], keywords: ['retry'], topic: 'handling' })
+				.map(e => e.id);
+			assert.deepStrictEqual(ids, ['epistle-001']);
+		});
+
+		it('should unindex by what was indexed when an entry is updated', () => {
+			assert.throws(() => {
+				registry.getEntry('epistle-002')!.personas[0] = 'renamed-in-place';
+			}, TypeError);
+			registry.updateEntry('epistle-002', { personas: ['qa-lead'] });
+
+			assert.deepStrictEqual(
+				registry.query({ personas: ['dev-guide'] }).map(e => e.id),
+				['epistle-001']
+			);
+		});
+
+		it('should return nothing when any filter has no candidates', () => {
+			assert.strictEqual(registry.query({ personas: ['dev-guide'], keywords: ['unknown'] }).length, 0);
+			assert.strictEqual(registry.query({ topic: 'zzz', keywords: ['retry'] }).length, 0);
+		});
+
+		it('should treat repeated filter values like single ones', () => {
+			const ids = registry.query({ keywords: ['RETRY', 'retry'], personas: ['qa-lead', 'QA-Lead', 'dev-guide'] }).map(e => e.id);
+			assert.deepStrictEqual(ids.sort(), ['epistle-001', 'epistle-003']);
+		});
+
+		it('should track updates in the indexes', () => {
+			registry.updateEntry('epistle-002', { topic: 'Retry budget', personas: ['qa-lead'] });
+
+			assert.strictEqual(registry.query({ topic: 'async' }).length, 0);
+			assert.deepStrictEqual(
+				registry.query({ personas: ['qa-lead'], topic: 'retry' }).map(e => e.id).sort(),
+				['epistle-002', 'epistle-003']
+			);
+			assert.strictEqual(registry.getEntriesByPersona('dev-guide').length, 1);
+		});
+	});
+
+	describe('Registry: Recent Entries', () => {
+		let registry: EpistleRegistry;
+		let workspace: TempWorkspace;
+
+		beforeEach(() => {
+			workspace = new TempWorkspace();
+			registry = createEpistleRegistry(workspace.getRootPath());
+			registry.addEntries(
+				['2025-10-03', '2025-10-09', '2025-10-01', '2025-10-09', '2025-10-05', '2025-10-07'].map(
+					(date, i) => ({ id: `epistle-00${i}`, type: 'letter' as const, date, personas: [] })
+				)
+			);
+		});
+
+		afterEach(() => {
+			workspace.cleanup();
+		});
+
+		it('should list all entries newest first', () => {
+			assert.deepStrictEqual(
+				registry.getRecentEntries().map(e => e.id),
+				['epistle-001', 'epistle-003', 'epistle-005', 'epistle-004', 'epistle-000', 'epistle-002']
+			);
+		});
+
+		it('should return the first `limit` of the full order when limited', () => {
+			const full = registry.getRecentEntries().map(e => e.id);
+			for (let limit = 0; limit <= 7; limit++) {
+				assert.deepStrictEqual(
+					registry.getRecentEntries(limit).map(e => e.id),
+					full.slice(0, limit)
+				);
+			}
+		});
+	});
+
 	describe('Registry: ID Generation', () => {
 		let registry: EpistleRegistry;
 		let workspace: TempWorkspace;
@@ -181,6 +814,11 @@ describe('Epistle System', () => {
 			assert.ok(/epistle-\d+-error-handling-[a-z0-9]+/.test(id1));
 		});
 
+		it('should embed a caller-supplied timestamp in the ID', () => {
+			const id = registry.generateId('letter', 'Error handling', 1761677263000);
+			assert.ok(id.startsWith('epistle-1761677263000-error-handling-'));
+		});
+
 		it('should generate unique inline IDs', () => {
 			const id1 = registry.generateId('inline');
 			const id2 = registry.generateId('inline');
@@ -219,6 +857,23 @@ describe('Epistle System', () => {
 			assert.ok(content.includes('const x = 42;'));
 		});
 
+		it('should use the context date for both file content and registry entry', () => {
+			const context: EpisodeContext = {
+				selectedCode: 'x',
+				selectedFile: 'src/test.ts',
+				selectedLines: { start: 1, end: 1 },
+				personas: ['dev-guide'],
+				topic: 'Midnight',
+				date: '2025-10-28',
+			};
+
+			const content = LetterEpistleGenerator.generateContent(context, 'epistle-001');
+			const entry = LetterEpistleGenerator.generateRegistryEntry('epistle-001', context, 'epistle-001.md');
+
+			assert.ok(content.includes('**Date**: 2025-10-28'));
+			assert.strictEqual(entry.date, '2025-10-28');
+		});
+
 		it('should create epistle file in epistles directory', () => {
 			const workspace = new TempWorkspace();
 			const epistlesDir = workspace.getEpistlesDir();
@@ -245,6 +900,42 @@ describe('Epistle System', () => {
 			workspace.cleanup();
 		});
 
+		it('should not overwrite an existing epistle file', () => {
+			const workspace = new TempWorkspace();
+			const epistlesDir = workspace.getEpistlesDir();
+			const existingPath = path.join(epistlesDir, 'epistle-dup.md');
+			fs.writeFileSync(existingPath, 'existing dialog');
+
+			const context: EpisodeContext = {
+				selectedCode: 'x',
+				selectedFile: 'src/test.ts',
+				selectedLines: { start: 1, end: 1 },
+				personas: ['dev-guide'],
+				topic: 'Collision',
+			};
+
+			const result = LetterEpistleGenerator.createFile(context, 'epistle-dup', epistlesDir);
+
+			assert.strictEqual(path.basename(result.filePath), 'epistle-dup-2.md');
+			assert.strictEqual(fs.readFileSync(existingPath, 'utf-8'), 'existing dialog');
+
+			workspace.cleanup();
+		});
+
+		it('should write new files under the next free name', () => {
+			const workspace = new TempWorkspace();
+			const epistlesDir = workspace.getEpistlesDir();
+
+			const first = LetterEpistleGenerator.writeNewFile(epistlesDir, 'advocate-abc', 'one');
+			const second = LetterEpistleGenerator.writeNewFile(epistlesDir, 'advocate-abc', 'two');
+
+			assert.strictEqual(path.basename(first), 'advocate-abc.md');
+			assert.strictEqual(path.basename(second), 'advocate-abc-2.md');
+			assert.strictEqual(fs.readFileSync(first, 'utf-8'), 'one');
+
+			workspace.cleanup();
+		});
+
 		it('should generate correct registry entry', () => {
 			const context: EpisodeContext = {
 				selectedCode: 'test',
@@ -405,6 +1096,7 @@ export class FileParser {
 			assert.strictEqual(entry.type, 'dynamic_persona');
 			assert.strictEqual(entry.name, 'parser-advocate');
 			assert.strictEqual(entry.source_file, 'src/parser.ts');
+			assert.strictEqual(entry.created_at!.split('T')[0], entry.date);
 		});
 	});
 
@@ -14,7 +14,6 @@
 
 import * as vscode from 'vscode';
 import * as path from 'path';
-import * as fs from 'fs';
 import { LetterEpistleGenerator, InlineEpistleGenerator, DynamicPersonaGenerator, EpisodeContext } from './epistleGenerator';
 import { EpistleRegistry } from './epistleRegistry';
 import { getActiveFlightPlan, getAllFlightPlans, formatFlightPlanInfo } from './flightPlanIntegration';
@@ -218,7 +217,8 @@ export async function recordLetterEpistle(
 			flightPlan,
 		});
 
-		// 5. Generate epistle
+		// 5. Generate epistle (one clock read: id, file **Date**, and registry date agree)
+		const now = Date.now();
 		const context: EpisodeContext = {
 			selectedCode,
 			selectedFile,
@@ -227,9 +227,10 @@ export async function recordLetterEpistle(
 			topic,
 			flightPlan,
 			language: editor.document.languageId,
+			date: new Date(now).toISOString().split('T')[0],
 		};
 
-		const id = registry.generateId('letter', topic);
+		const id = registry.generateId('letter', topic, now);
 		const { filePath, content } = LetterEpistleGenerator.createFile(context, id, epistlesDir);
 
 		telemetry('EPISTLE', 'STEP', 'Epistle file created', {
@@ -324,6 +325,7 @@ export async function recordInlineEpistle(
 		telemetry('EPISTLE', 'STEP', 'Topic provided', { topic });
 
 		// 4. Generate comment block
+		const now = Date.now();
 		const context: EpisodeContext = {
 			selectedCode,
 			selectedFile,
@@ -331,9 +333,10 @@ export async function recordInlineEpistle(
 			personas,
 			topic,
 			language: editor.document.languageId,
+			date: new Date(now).toISOString().split('T')[0],
 		};
 
-		const id = registry.generateId('inline');
+		const id = registry.generateId('inline', undefined, now);
 		const commentBlock = InlineEpistleGenerator.generateCommentBlock(context, id);
 
 		// 5. Insert into editor
@@ -440,6 +443,68 @@ export async function createDynamicPersona(
 	}
 }
 
+/**
+ * Add a file to a letter epistle's context
+ *
+ * User flow:
+ * 1. With a file open, run "Add file to epistle context"
+ * 2. Pick the letter epistle it belongs to
+ * 3. The file joins the epistle's context (once, however often this is run)
+ */
+export async function addFileToEpistleContext(
+	filepath: string,
+	registry: EpistleRegistry,
+	telemetry: TelemetryFn
+): Promise<void> {
+	telemetry('EPISTLE', 'START', 'Add file to epistle context', {
+		file: path.basename(filepath),
+	});
+
+	try {
+		// 1. Pick the epistle
+		const letters = registry.getEntriesByType('letter');
+		if (letters.length === 0) {
+			vscode.window.showInformationMessage('No letter epistles found in this workspace');
+			return;
+		}
+
+		const selected = await vscode.window.showQuickPick(
+			letters.map(entry => ({
+				label: entry.topic || entry.id,
+				description: entry.date,
+				id: entry.id,
+			})),
+			{
+				placeHolder: 'Select the epistle this file belongs to',
+				title: 'Add file to epistle context',
+			}
+		);
+		if (!selected) {
+			telemetry('EPISTLE', 'ERROR', 'No epistle selected');
+			return;
+		}
+
+		// 2. Record the file (addContext skips files already listed)
+		const added = registry.addContext(selected.id, [filepath]);
+
+		telemetry('EPISTLE', 'SUCCESS', 'Epistle context updated', {
+			id: selected.id,
+			added,
+		});
+
+		vscode.window.showInformationMessage(
+			added > 0
+				? `✓ Added ${path.basename(filepath)} to "${selected.label}"`
+				: `${path.basename(filepath)} is already in "${selected.label}"`
+		);
+	} catch (error: any) {
+		telemetry('EPISTLE', 'ERROR', 'Failed to add epistle context', {
+			error: error.message,
+		});
+		vscode.window.showErrorMessage(`Failed to add epistle context: ${error.message}`);
+	}
+}
+
 /**
  * Record file advocate letter epistle
  *
@@ -478,38 +543,44 @@ export async function recordFileAdvocateEpistle(
 		}
 
 		// For each persona, create advocate epistles
-		const epistlesDir = path.join(workspaceRoot, '.rhizome', 'plugins', 'epistles');
-		for (const persona of personas) {
-			log('EPISTLE', 'STEP', `Processing advocate epistle for persona: ${persona}`);
-
-			// Create the epistle content
-			const epistleContent = createFileAdvocateEpistle(analysis, persona, '(Add persona opinion here)');
-
-			// Generate ID and save file
-			const id = `advocate-${Math.random().toString(36).substring(2, 11)}`;
-			const filename = `${id}.md`;
-			const epistleFilePath = path.join(epistlesDir, filename);
-
-			// Ensure directory exists and write file
-			fs.mkdirSync(epistlesDir, { recursive: true });
-			fs.writeFileSync(epistleFilePath, epistleContent, 'utf-8');
-
-			// Register the epistle
-			const entry: any = {
-				id,
-				type: 'letter' as const,
-				file: filename,
-				format: 'letter',
-				name: `${analysis.filename} advocate: ${persona}`,
-				personas: [persona],
-				created_at: new Date().toISOString(),
-				tags: ['file-advocate', analysis.role],
-				linked_file: filepath,
-				linked_flight_plan: getActiveFlightPlan(workspaceRoot)?.id,
-			};
-
-			registry.addEntry(entry);
-			log('EPISTLE', 'SUCCESS', `Advocate epistle created for ${persona}`, { filename });
+		const epistlesDir = registry.getEpistlesDir();
+		const entries: any[] = [];
+		const createdAt = new Date().toISOString();
+		try {
+			for (const persona of personas) {
+				log('EPISTLE', 'STEP', `Processing advocate epistle for persona: ${persona}`);
+
+				// Create the epistle content
+				const epistleContent = createFileAdvocateEpistle(analysis, persona, '(Add persona opinion here)');
+
+				// Generate ID and save file (never clobbers; retries id-2.md, ... on collision)
+				const id = `advocate-${Math.random().toString(36).substring(2, 11)}`;
+				const filename = path.basename(
+					LetterEpistleGenerator.writeNewFile(epistlesDir, id, epistleContent)
+				);
+
+				// Register the epistle
+				const entry: any = {
+					id,
+					type: 'letter' as const,
+					file: filename,
+					format: 'letter',
+					name: `${analysis.filename} advocate: ${persona}`,
+					personas: [persona],
+					created_at: createdAt,
+					tags: ['file-advocate', analysis.role],
+					linked_file: filepath,
+					linked_flight_plan: getActiveFlightPlan(workspaceRoot)?.id,
+				};
+
+				entries.push(entry);
+				log('EPISTLE', 'SUCCESS', `Advocate epistle created for ${persona}`, { filename });
+			}
+		} finally {
+			// Register everything written so far in one batch, even if a later persona failed
+			if (entries.length > 0) {
+				registry.addEntries(entries);
+			}
 		}
 
 		vscode.window.showInformationMessage(
@@ -577,21 +648,25 @@ export async function addFileAdvocateComment(
 	}
 }
 
+/**
+ * File extension → language for advocate comments
+ */
+const ADVOCATE_COMMENT_LANGUAGES: Record<string, string> = {
+	'.ts': 'typescript',
+	'.tsx': 'typescript',
+	'.js': 'javascript',
+	'.jsx': 'javascript',
+	'.py': 'python',
+	'.rb': 'ruby',
+	'.go': 'go',
+	'.rs': 'rust',
+	'.java': 'java',
+};
+
 /**
  * Helper: Detect language from file extension
  */
 function detectLanguageFromFile(filepath: string): string {
 	const ext = path.extname(filepath).toLowerCase();
-	const extMap: Record<string, string> = {
-		'.ts': 'typescript',
-		'.tsx': 'typescript',
-		'.js': 'javascript',
-		'.jsx': 'javascript',
-		'.py': 'python',
-		'.rb': 'ruby',
-		'.go': 'go',
-		'.rs': 'rust',
-		'.java': 'java',
-	};
-	return extMap[ext] || 'typescript';
+	return ADVOCATE_COMMENT_LANGUAGES[ext] || 'typescript';
 }
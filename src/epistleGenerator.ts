@@ -16,6 +16,52 @@ import * as path from 'path';
 import * as vscode from 'vscode';
 import { EpistleRegistryEntry } from './epistleRegistry';
 
+/**
+ * Static tail of every letter epistle (prepared once, not rebuilt per file)
+ */
+const LETTER_NOTES_SECTION = `## Notes
+
+- Use this space to record the multi-persona discussion about the code
+- Each persona can ask questions, challenge assumptions, propose solutions
+- Capture the reasoning behind your design decision
+- Mark status as "resolved" when the discussion is complete
+- You can link this epistle to a flight plan to keep design reasoning with your work
+`;
+
+/**
+ * Comment syntax per language, used by inline epistles
+ */
+const COMMENT_SYNTAX: Record<string, { single: string; start: string; end: string }> = {
+	typescript: { single: '//', start: '/*', end: '*/' },
+	javascript: { single: '//', start: '/*', end: '*/' },
+	python: { single: '#', start: '"""', end: '"""' },
+	java: { single: '//', start: '/*', end: '*/' },
+	go: { single: '//', start: '/*', end: '*/' },
+	rust: { single: '//', start: '/*', end: '*/' },
+	cpp: { single: '//', start: '/*', end: '*/' },
+	c: { single: '//', start: '/*', end: '*/' },
+	csharp: { single: '//', start: '/*', end: '*/' },
+	ruby: { single: '#', start: '=begin', end: '=end' },
+	html: { single: '<!-- ', start: '<!--', end: '-->' },
+	css: { single: '', start: '/*', end: '*/' },
+};
+
+/**
+ * File extension → language, used by dynamic persona analysis
+ */
+const EXTENSION_LANGUAGES: Record<string, string> = {
+	'.ts': 'typescript',
+	'.js': 'javascript',
+	'.py': 'python',
+	'.java': 'java',
+	'.go': 'go',
+	'.rs': 'rust',
+	'.cpp': 'cpp',
+	'.c': 'c',
+	'.cs': 'csharp',
+	'.rb': 'ruby',
+};
+
 /**
  * Epistle context: information needed to generate an epistle
  */
@@ -27,6 +73,14 @@ export interface EpisodeContext {
 	topic: string;
 	flightPlan?: string;
 	language?: string; // Programming language for inline epistles
+	date?: string; // YYYY-MM-DD; set once per flow so file and registry agree (defaults to today)
+}
+
+/**
+ * Today's date as YYYY-MM-DD (UTC, matching toISOString)
+ */
+function today(): string {
+	return new Date().toISOString().split('T')[0];
 }
 
 /**
@@ -44,7 +98,7 @@ export class LetterEpistleGenerator {
 	 * - Calls to action: "user fills in or uses persona query to populate"
 	 */
 	static generateContent(context: EpisodeContext, id: string): string {
-		const date = new Date().toISOString().split('T')[0]; // YYYY-MM-DD
+		const date = context.date ?? today(); // YYYY-MM-DD
 		const personaList = context.personas.join(' ↔ ');
 		const codeLocation = `${path.basename(context.selectedFile)}:${context.selectedLines.start}-${context.selectedLines.end}`;
 
@@ -70,37 +124,54 @@ ${context.selectedCode}
 
 ${dialogSection}
 
-## Notes
-
-- Use this space to record the multi-persona discussion about the code
-- Each persona can ask questions, challenge assumptions, propose solutions
-- Capture the reasoning behind your design decision
-- Mark status as "resolved" when the discussion is complete
-- You can link this epistle to a flight plan to keep design reasoning with your work
-`;
+${LETTER_NOTES_SECTION}`;
 
 		return template;
 	}
 
 	/**
 	 * Create a letter epistle file
+	 *
+	 * @rhizome: What if the file already exists?
+	 * We never overwrite someone's dialog. The 'wx' flag creates the file only if
+	 * it's new, in the same call that writes it (no exists-then-write race), and on
+	 * a collision we try id-2.md, id-3.md, ...
 	 */
 	static createFile(
 		context: EpisodeContext,
 		id: string,
 		epistlesDirectory: string
 	): { filePath: string; content: string } {
-		const filename = `${id}.md`;
-		const filePath = path.join(epistlesDirectory, filename);
 		const content = this.generateContent(context, id);
+		const filePath = this.writeNewFile(epistlesDirectory, id, content);
+		return { filePath, content };
+	}
 
+	/**
+	 * Write content to <id>.md (or <id>-2.md, <id>-3.md, ... if taken) and return the path
+	 *
+	 * Shared by every flow that creates epistle files, so none of them can clobber
+	 * an existing dialog or fail outright on a name collision.
+	 */
+	static writeNewFile(epistlesDirectory: string, id: string, content: string): string {
 		// Ensure directory exists
 		fs.mkdirSync(epistlesDirectory, { recursive: true });
 
-		// Write file
-		fs.writeFileSync(filePath, content, 'utf-8');
+		for (let counter = 1; ; counter++) {
+			const filePath = path.join(epistlesDirectory, this.candidateFilename(id, counter));
+			try {
+				fs.writeFileSync(filePath, content, { encoding: 'utf-8', flag: 'wx' });
+				return filePath;
+			} catch (e: any) {
+				if (e.code !== 'EEXIST') {
+					throw e;
+				}
+			}
+		}
+	}
 
-		return { filePath, content };
+	private static candidateFilename(id: string, counter: number): string {
+		return counter === 1 ? `${id}.md` : `${id}-${counter}.md`;
 	}
 
 	/**
@@ -114,7 +185,7 @@ ${dialogSection}
 		return {
 			id,
 			type: 'letter',
-			date: new Date().toISOString().split('T')[0],
+			date: context.date ?? today(),
 			personas: context.personas,
 			topic: context.topic,
 			status: 'draft',
@@ -136,26 +207,11 @@ export class InlineEpistleGenerator {
 	 * Detect comment syntax for a given language
 	 *
 	 * @rhizome: How do we know the comment syntax?
-	 * Map of common languages to their comment characters.
+	 * Map of common languages to their comment characters (COMMENT_SYNTAX).
 	 * If language not found, default to //.
 	 */
 	private static getCommentSyntax(language: string): { single: string; start: string; end: string } {
-		const syntaxMap: Record<string, { single: string; start: string; end: string }> = {
-			typescript: { single: '//', start: '/*', end: '*/' },
-			javascript: { single: '//', start: '/*', end: '*/' },
-			python: { single: '#', start: '"""', end: '"""' },
-			java: { single: '//', start: '/*', end: '*/' },
-			go: { single: '//', start: '/*', end: '*/' },
-			rust: { single: '//', start: '/*', end: '*/' },
-			cpp: { single: '//', start: '/*', end: '*/' },
-			c: { single: '//', start: '/*', end: '*/' },
-			csharp: { single: '//', start: '/*', end: '*/' },
-			ruby: { single: '#', start: '=begin', end: '=end' },
-			html: { single: '<!-- ', start: '<!--', end: '-->' },
-			css: { single: '', start: '/*', end: '*/' },
-		};
-
-		return syntaxMap[language.toLowerCase()] || { single: '//', start: '/*', end: '*/' };
+		return COMMENT_SYNTAX[language.toLowerCase()] || { single: '//', start: '/*', end: '*/' };
 	}
 
 	/**
@@ -212,7 +268,7 @@ ${dialogLines}`;
 		return {
 			id,
 			type: 'inline',
-			date: new Date().toISOString().split('T')[0],
+			date: context.date ?? today(),
 			personas: context.personas,
 			inline_file: context.selectedFile,
 			lines: `${context.selectedLines.start}-${context.selectedLines.end}`,
@@ -341,14 +397,16 @@ export class DynamicPersonaGenerator {
 		name: string,
 		sourceFile: string
 	): EpistleRegistryEntry {
+		// One clock read so date and created_at can't straddle midnight
+		const createdAt = new Date().toISOString();
 		return {
 			id,
 			type: 'dynamic_persona',
-			date: new Date().toISOString().split('T')[0],
+			date: createdAt.split('T')[0],
 			personas: [name],
 			source_file: sourceFile,
 			name,
-			created_at: new Date().toISOString(),
+			created_at: createdAt,
 			keywords: ['dynamic-persona', name],
 		};
 	}
@@ -357,19 +415,7 @@ export class DynamicPersonaGenerator {
 
 	private static detectLanguage(filepath: string): string {
 		const ext = path.extname(filepath).toLowerCase();
-		const extMap: Record<string, string> = {
-			'.ts': 'typescript',
-			'.js': 'javascript',
-			'.py': 'python',
-			'.java': 'java',
-			'.go': 'go',
-			'.rs': 'rust',
-			'.cpp': 'cpp',
-			'.c': 'c',
-			'.cs': 'csharp',
-			'.rb': 'ruby',
-		};
-		return extMap[ext] || 'text';
+		return EXTENSION_LANGUAGES[ext] || 'text';
 	}
 
 	private static extractImports(content: string, language: string): string[] {
@@ -54,21 +54,290 @@ export interface EpistleRegistryEntry {
 	keywords?: string[];
 }
 
+/**
+ * Structured epistle query: every given filter must match
+ *
+ * - personas: entry has any of these personas (case-insensitive)
+ * - keywords: entry has any of these keywords (case-insensitive)
+ * - topic: a phrase of whole words in the entry's topic (case-insensitive)
+ */
+export interface EpistleQuery {
+	personas?: string[];
+	keywords?: string[];
+	topic?: string;
+}
+
+/**
+ * Entries of one registry file plus the lookups built from them
+ *
+ * @rhizome: Why one object shared by the cache and every registry?
+ * Copying a parsed registry costs more than parsing it again. Entries are frozen
+ * instead, so handing the same state to each registry is safe, and setEntry
+ * updates it in place in the same step that appends the change to the file.
+ */
+interface RegistryState {
+	entries: Map<string, EpistleRegistryEntry>;
+
+	// Registry position of each id; updates keep it, so index lookups stay in registry order
+	position: Map<string, number>;
+
+	// Secondary indexes (id → entry is the entries map itself)
+	inlineFileIndex: Map<string, Set<string>>;
+	sourceFileIndex: Map<string, Set<string>>;
+
+	// Built by the first search or query against this state, then kept in step by setEntry
+	search?: SearchIndexes;
+
+	// Lines in the file that a later line with the same id replaced
+	superseded: number;
+}
+
+function emptyState(): RegistryState {
+	return {
+		superseded: 0,
+		entries: new Map(),
+		position: new Map(),
+		inlineFileIndex: new Map(),
+		sourceFileIndex: new Map(),
+	};
+}
+
+/**
+ * Registry state, valid while the file's mtime and size are unchanged
+ */
+interface RegistryCacheEntry {
+	mtimeNs: bigint;
+	size: bigint;
+	state: RegistryState;
+}
+
+/**
+ * Parsed registries shared by every EpistleRegistry in this process
+ *
+ * @rhizome: Why cache at module level?
+ * Commands and the sidebar each construct a registry for the same workspace.
+ * Keying on path and checking (mtime, size) lets repeat loads skip the read and
+ * parse entirely until something actually changes the file on disk.
+ */
+const registryCache = new Map<string, RegistryCacheEntry>();
+
+/**
+ * Drop all cached registries (tests, or after out-of-band edits)
+ */
+export function invalidateRegistryCache(): void {
+	registryCache.clear();
+}
+
+/**
+ * Lowercased copies of the fields search() and the inverted indexes use
+ *
+ * Kept per entry so unindexing removes exactly the keys that were added,
+ * without folding or tokenizing the text a second time.
+ */
+interface SearchText {
+	topic: string | undefined;
+	topicTokens: string[];
+	personas: string[];
+	keywords: string[];
+	context: string[];
+}
+
+/**
+ * What search() and query() look entries up by
+ */
+interface SearchIndexes {
+	// Lowercased once per entry rather than once per entry per query; never serialized
+	text: Map<string, SearchText>;
+
+	// Inverted indexes for query(): lowercased persona / keyword / topic word → ids
+	personas: Map<string, Set<string>>;
+	keywords: Map<string, Set<string>>;
+	topics: Map<string, Set<string>>;
+}
+
+function indexSearchText(indexes: SearchIndexes, entry: EpistleRegistryEntry): void {
+	const topic = typeof entry.topic === 'string' ? entry.topic.toLowerCase() : undefined;
+	const text: SearchText = {
+		topic,
+		topicTokens: topic ? tokenize(topic) : [],
+		personas: lowerStrings(entry.personas),
+		keywords: lowerStrings(entry.keywords),
+		context: lowerStrings(entry.context),
+	};
+	indexes.text.set(entry.id, text);
+
+	for (const persona of text.personas) {
+		addToIndex(indexes.personas, persona, entry.id);
+	}
+	for (const keyword of text.keywords) {
+		addToIndex(indexes.keywords, keyword, entry.id);
+	}
+	for (const token of text.topicTokens) {
+		addToIndex(indexes.topics, token, entry.id);
+	}
+}
+
+function unindexSearchText(indexes: SearchIndexes, id: string): void {
+	const text = indexes.text.get(id);
+	indexes.text.delete(id);
+
+	for (const persona of text?.personas ?? []) {
+		removeFromIndex(indexes.personas, persona, id);
+	}
+	for (const keyword of text?.keywords ?? []) {
+		removeFromIndex(indexes.keywords, keyword, id);
+	}
+	for (const token of text?.topicTokens ?? []) {
+		removeFromIndex(indexes.topics, token, id);
+	}
+}
+
+/**
+ * Lowercase the string elements of a field that should be a string array
+ *
+ * Registry lines come from disk (and other tools), so a field may be missing,
+ * a bare string, or hold non-strings; those contribute nothing to the indexes.
+ */
+function lowerStrings(value: unknown): string[] {
+	if (!Array.isArray(value)) {
+		return [];
+	}
+	return value.filter((item): item is string => typeof item === 'string').map(item => item.toLowerCase());
+}
+
+/**
+ * Freeze a value and everything it holds, so shared entries can't be edited in place
+ */
+function deepFreeze<T>(value: T): T {
+	if (typeof value === 'object' && value !== null && !Object.isFrozen(value)) {
+		Object.freeze(value);
+		for (const key in value) {
+			deepFreeze(value[key]);
+		}
+	}
+	return value;
+}
+
+/**
+ * Add an id under a key in a one-to-many index
+ */
+function addToIndex(index: Map<string, Set<string>>, key: string, id: string): void {
+	const ids = index.get(key);
+	if (ids) {
+		ids.add(id);
+	} else {
+		index.set(key, new Set([id]));
+	}
+}
+
+/**
+ * Remove an id from under a key in a one-to-many index
+ */
+function removeFromIndex(index: Map<string, Set<string>>, key: string, id: string): void {
+	const ids = index.get(key);
+	if (ids) {
+		ids.delete(id);
+		if (ids.size === 0) {
+			index.delete(key);
+		}
+	}
+}
+
+/**
+ * True for a plain JSON object (what every registry line should hold)
+ */
+function isRecord(value: unknown): value is Record<string, unknown> {
+	return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+/**
+ * True if a batched parse produced exactly one object per registry line
+ */
+function isRecordBatch(batch: unknown, lineCount: number): batch is EpistleRegistryEntry[] {
+	return Array.isArray(batch) && batch.length === lineCount && batch.every(isRecord);
+}
+
+/**
+ * Compact once superseded lines outnumber live entries, and there are at least this many
+ */
+const COMPACT_MIN_SUPERSEDED = 64;
+
+/**
+ * Registries larger than this are parsed straight from a byte buffer
+ */
+const LARGE_REGISTRY_BYTES = 256 * 1024;
+
+/**
+ * True if buffer[start, end) holds only spaces, tabs, or carriage returns
+ */
+function isBlankBytes(buffer: Buffer, start: number, end: number): boolean {
+	for (let i = start; i < end; i++) {
+		const byte = buffer[i];
+		if (byte !== 0x20 && byte !== 0x09 && byte !== 0x0d) {
+			return false;
+		}
+	}
+	return true;
+}
+
+/**
+ * True if the file's last byte (of `size` bytes) is a newline
+ */
+function endsWithNewline(filepath: string, size: number): boolean {
+	const fd = fs.openSync(filepath, 'r');
+	try {
+		const last = Buffer.alloc(1);
+		fs.readSync(fd, last, 0, 1, size - 1);
+		return last[0] === 0x0a;
+	} finally {
+		fs.closeSync(fd);
+	}
+}
+
+/**
+ * Collect the non-blank lines of NDJSON text
+ *
+ * @rhizome: Why not content.split('\n').filter(l => l.trim())?
+ * That builds an array of every line, then a trimmed copy of each, then a second
+ * array. Scanning with indexOf slices each line once and keeps only the ones
+ * that hold something.
+ */
+function nonBlankLines(content: string): string[] {
+	const lines: string[] = [];
+	let start = 0;
+	while (start < content.length) {
+		let end = content.indexOf('\n', start);
+		if (end === -1) {
+			end = content.length;
+		}
+		const line = content.slice(start, end);
+		if (/\S/.test(line)) {
+			lines.push(line);
+		}
+		start = end + 1;
+	}
+	return lines;
+}
+
+/**
+ * Split lowercased text into the word tokens used by the topic index
+ */
+function tokenize(text: string): string[] {
+	return text.split(/[^\p{L}\p{N}]+/u).filter(token => token.length > 0);
+}
+
 /**
  * Registry manager for epistles
  */
 export class EpistleRegistry {
+	private epistlesDir: string;
 	private registryPath: string;
-	private entries: Map<string, EpistleRegistryEntry> = new Map();
+	private state: RegistryState = emptyState();
 
 	constructor(workspaceRoot: string) {
-		this.registryPath = path.join(
-			workspaceRoot,
-			'.rhizome',
-			'plugins',
-			'epistles',
-			'registry.ndjson'
-		);
+		// Resolved once; the workspace root doesn't change for a registry's lifetime
+		this.epistlesDir = path.join(workspaceRoot, '.rhizome', 'plugins', 'epistles');
+		this.registryPath = path.join(this.epistlesDir, 'registry.ndjson');
 		this.loadRegistry();
 	}
 
@@ -78,116 +347,481 @@ export class EpistleRegistry {
 	 * @rhizome: How do we read NDJSON?
 	 * Line-delimited JSON: each line is one JSON object.
 	 * We split by newline, parse each non-empty line.
+	 * Later lines win: an appended update supersedes the earlier record with the same id.
+	 * Skipped entirely when the cached state still matches the file on disk.
 	 */
 	private loadRegistry(): void {
 		try {
 			if (!fs.existsSync(this.registryPath)) {
 				// Create empty registry if it doesn't exist
-				fs.mkdirSync(path.dirname(this.registryPath), { recursive: true });
+				fs.mkdirSync(this.epistlesDir, { recursive: true });
 				fs.writeFileSync(this.registryPath, '');
+				this.state = emptyState();
+				this.rememberSnapshot();
+				return;
+			}
+
+			const stat = fs.statSync(this.registryPath, { bigint: true });
+			const cached = registryCache.get(this.registryPath);
+			if (cached && cached.mtimeNs === stat.mtimeNs && cached.size === stat.size) {
+				// Shared as is: entries are frozen and the indexes are already built
+				this.state = cached.state;
 				return;
 			}
 
-			const content = fs.readFileSync(this.registryPath, 'utf-8');
-			const lines = content.split('\n').filter(line => line.trim());
+			const parsed =
+				stat.size > LARGE_REGISTRY_BYTES
+					? EpistleRegistry.parseLargeRegistry(this.registryPath, Number(stat.size))
+					: EpistleRegistry.parseLines(nonBlankLines(fs.readFileSync(this.registryPath, 'utf-8')));
 
-			this.entries.clear();
-			for (const line of lines) {
-				try {
-					const entry = JSON.parse(line) as EpistleRegistryEntry;
-					this.entries.set(entry.id, entry);
-				} catch (e) {
-					console.error(`Failed to parse registry line: ${line}`);
-				}
+			this.state = emptyState();
+			for (const entry of parsed) {
+				this.state.entries.set(entry.id, deepFreeze(entry));
 			}
+			for (const entry of this.state.entries.values()) {
+				this.state.position.set(entry.id, this.state.position.size);
+				this.indexFiles(entry);
+			}
+			this.state.superseded = parsed.length - this.state.entries.size;
+			this.rememberSnapshot(stat);
+			this.compactIfBloated();
 		} catch (e) {
 			console.error(`Failed to load epistle registry: ${e}`);
 		}
 	}
 
+	/**
+	 * Store an entry and keep the secondary indexes in step
+	 *
+	 * @rhizome: Why indexes when we already have a Map by id?
+	 * "Which persona speaks for this file?" and "which inline epistles live here?"
+	 * were full scans of every entry. Indexing by file makes them direct lookups.
+	 * The stored entry is a frozen copy: the caller's object stays theirs to change.
+	 */
+	private setEntry(entry: EpistleRegistryEntry): void {
+		const stored = deepFreeze(structuredClone(entry));
+		const previous = this.state.entries.get(stored.id);
+		if (previous) {
+			this.unindexFiles(previous);
+			this.state.superseded++;
+		} else {
+			this.state.position.set(stored.id, this.state.position.size);
+		}
+		this.state.entries.set(stored.id, stored);
+		this.indexFiles(stored);
+
+		if (this.state.search) {
+			unindexSearchText(this.state.search, stored.id);
+			indexSearchText(this.state.search, stored);
+		}
+	}
+
+	private indexFiles(entry: EpistleRegistryEntry): void {
+		if (entry.type === 'inline' && entry.inline_file) {
+			addToIndex(this.state.inlineFileIndex, entry.inline_file, entry.id);
+		}
+		if (entry.type === 'dynamic_persona' && entry.source_file) {
+			addToIndex(this.state.sourceFileIndex, entry.source_file, entry.id);
+		}
+	}
+
+	private unindexFiles(entry: EpistleRegistryEntry): void {
+		if (entry.type === 'inline' && entry.inline_file) {
+			removeFromIndex(this.state.inlineFileIndex, entry.inline_file, entry.id);
+		}
+		if (entry.type === 'dynamic_persona' && entry.source_file) {
+			removeFromIndex(this.state.sourceFileIndex, entry.source_file, entry.id);
+		}
+	}
+
+	/**
+	 * Search indexes for the current state, built on first use
+	 *
+	 * @rhizome: Why not build them while loading?
+	 * Lowercasing and tokenizing every entry is most of the cost of a load, and
+	 * many registries (a command recording one epistle) never search. Built here,
+	 * they live in the shared state: one pass per version of the file, reused by
+	 * every registry and every reload that hits the cache.
+	 */
+	private searchIndexes(): SearchIndexes {
+		if (!this.state.search) {
+			const indexes: SearchIndexes = {
+				text: new Map(),
+				personas: new Map(),
+				keywords: new Map(),
+				topics: new Map(),
+			};
+			for (const entry of this.state.entries.values()) {
+				indexSearchText(indexes, entry);
+			}
+			this.state.search = indexes;
+		}
+		return this.state.search;
+	}
+
+	/**
+	 * Resolve indexed ids back to entries, in registry order
+	 *
+	 * @rhizome: Why sort when the Set already has an order?
+	 * Re-indexing an updated entry moves its id to the end of the Set,
+	 * but callers (getDynamicPersonaForFile's "first match") expect the order entries were registered in.
+	 */
+	private entriesFor(ids: Set<string> | undefined): EpistleRegistryEntry[] {
+		if (!ids) {
+			return [];
+		}
+		return Array.from(ids)
+			.sort((a, b) => this.state.position.get(a)! - this.state.position.get(b)!)
+			.map(id => this.state.entries.get(id)!);
+	}
+
+	/**
+	 * Parse NDJSON lines into registry entries
+	 *
+	 * @rhizome: Why wrap every line into one array?
+	 * One JSON.parse over "[line,line,...]" stays inside the native parser for the
+	 * whole file instead of crossing into it once per line. If any line is malformed,
+	 * smuggles in extra values, or isn't an object (null, 42, "str"), the batch is
+	 * rejected and we fall back to per-line parsing, so one bad line only loses itself.
+	 */
+	private static parseLines(lines: string[]): EpistleRegistryEntry[] {
+		try {
+			const batch = JSON.parse(`[${lines.join(',')}]`);
+			if (isRecordBatch(batch, lines.length)) {
+				return batch;
+			}
+		} catch (e) {
+			// Fall through to per-line parsing
+		}
+
+		const entries: EpistleRegistryEntry[] = [];
+		for (const line of lines) {
+			try {
+				const record = JSON.parse(line);
+				if (isRecord(record)) {
+					entries.push(record as unknown as EpistleRegistryEntry);
+				} else {
+					console.error(`Skipping non-object registry line: ${line}`);
+				}
+			} catch (e) {
+				console.error(`Failed to parse registry line: ${line}`);
+			}
+		}
+		return entries;
+	}
+
+	/**
+	 * Parse a large registry file without building intermediate strings
+	 *
+	 * @rhizome: What's different from the small-file path?
+	 * There we decode the file, slice out lines, and join them into "[...]": for a
+	 * big registry that's several full-size copies alive at once. Here the bytes are
+	 * read into one buffer (with a spare byte in front), and rewritten in place into
+	 * "[line,line,...]": newlines become commas, blank lines are squeezed out. One
+	 * decode, one JSON.parse. Raw newlines can't occur inside JSON strings, so the
+	 * rewrite never touches a value. Anything unexpected falls back to the line path.
+	 */
+	private static parseLargeRegistry(registryPath: string, size: number): EpistleRegistryEntry[] {
+		const buffer = Buffer.allocUnsafe(size + 2);
+		let length = 0;
+		const fd = fs.openSync(registryPath, 'r');
+		try {
+			while (length < size) {
+				const read = fs.readSync(fd, buffer, 1 + length, size - length, length);
+				if (read === 0) {
+					break;
+				}
+				length += read;
+			}
+		} finally {
+			fs.closeSync(fd);
+		}
+
+		// The write cursor never passes the read cursor, so rewriting in place is safe
+		const end = 1 + length;
+		let write = 1;
+		let lineCount = 0;
+		let lineStart = 1;
+		while (lineStart < end) {
+			let lineEnd = buffer.indexOf(0x0a, lineStart);
+			if (lineEnd === -1 || lineEnd > end) {
+				lineEnd = end;
+			}
+			if (!isBlankBytes(buffer, lineStart, lineEnd)) {
+				if (lineCount > 0) {
+					buffer[write++] = 0x2c; // ,
+				}
+				buffer.copy(buffer, write, lineStart, lineEnd);
+				write += lineEnd - lineStart;
+				lineCount++;
+			}
+			lineStart = lineEnd + 1;
+		}
+		buffer[0] = 0x5b; // [
+		buffer[write++] = 0x5d; // ]
+
+		try {
+			const batch = JSON.parse(buffer.toString('utf-8', 0, write));
+			if (isRecordBatch(batch, lineCount)) {
+				return batch;
+			}
+		} catch (e) {
+			// Fall through to the line-by-line path
+		}
+		return this.parseLines(nonBlankLines(fs.readFileSync(registryPath, 'utf-8')));
+	}
+
 	/**
 	 * Save registry to disk
+	 *
+	 * Compact NDJSON only (never indented): one stringify per entry, mapped in the
+	 * same pass that collects them, then a single write.
 	 */
 	private saveRegistry(): void {
 		try {
-			const lines = Array.from(this.entries.values()).map(entry =>
-				JSON.stringify(entry)
-			);
+			const lines = Array.from(this.state.entries.values(), entry => JSON.stringify(entry));
 			const content = lines.join('\n');
 			fs.writeFileSync(this.registryPath, content);
+			this.state.superseded = 0;
+			this.rememberSnapshot();
 		} catch (e) {
 			console.error(`Failed to save epistle registry: ${e}`);
 		}
 	}
 
+	/**
+	 * Append entries to the end of the registry file
+	 *
+	 * @rhizome: Why append instead of rewriting?
+	 * Adding or updating one epistle shouldn't cost a rewrite of every other one.
+	 * NDJSON is a log: we append the new (or updated) record and let load fold
+	 * duplicates by id. compactIfBloated() rewrites the file once superseded lines pile up.
+	 */
+	private appendToRegistry(entries: EpistleRegistryEntry[]): void {
+		try {
+			const cached = registryCache.get(this.registryPath);
+			const before = fs.existsSync(this.registryPath)
+				? fs.statSync(this.registryPath, { bigint: true })
+				: undefined;
+
+			// Existing files may not end in a newline; add one only when it's missing
+			const separator =
+				before && before.size > 0n && !endsWithNewline(this.registryPath, Number(before.size)) ? '\n' : '';
+			const lines = entries.map(entry => JSON.stringify(entry)).join('\n');
+			fs.appendFileSync(this.registryPath, separator + lines);
+
+			// setEntry already updated our state; if the cache holds it and was current, re-stamp it
+			if (
+				cached &&
+				before &&
+				cached.state === this.state &&
+				cached.mtimeNs === before.mtimeNs &&
+				cached.size === before.size
+			) {
+				const after = fs.statSync(this.registryPath, { bigint: true });
+				cached.mtimeNs = after.mtimeNs;
+				cached.size = after.size;
+			} else {
+				registryCache.delete(this.registryPath);
+			}
+		} catch (e) {
+			console.error(`Failed to append to epistle registry: ${e}`);
+		}
+	}
+
+	/**
+	 * Append changed entries, compacting if stale lines have piled up
+	 */
+	private persist(entries: EpistleRegistryEntry[]): void {
+		this.appendToRegistry(entries);
+		this.compactIfBloated();
+	}
+
+	/**
+	 * Rewrite the registry with one line per epistle, dropping superseded records
+	 */
+	compact(): void {
+		this.saveRegistry();
+	}
+
+	/**
+	 * Compact when superseded lines have piled up
+	 *
+	 * @rhizome: Why not compact on every update?
+	 * That's the full rewrite appending was meant to avoid. Waiting until stale
+	 * lines outnumber live ones keeps the file (and every load's parse) within
+	 * about twice its compacted size, while each rewrite pays for many appends.
+	 */
+	private compactIfBloated(): void {
+		const { superseded, entries } = this.state;
+		if (superseded >= COMPACT_MIN_SUPERSEDED && superseded > entries.size) {
+			this.compact();
+		}
+	}
+
+	/**
+	 * Record the current state as the cached snapshot for this registry file
+	 *
+	 * @rhizome: Why stat after writing?
+	 * Our own save changes mtime. Storing the post-write stat means the next
+	 * load (here or in another registry instance) hits the cache instead of re-reading.
+	 */
+	private rememberSnapshot(stat?: fs.BigIntStats): void {
+		const current = stat ?? fs.statSync(this.registryPath, { bigint: true });
+		registryCache.set(this.registryPath, {
+			mtimeNs: current.mtimeNs,
+			size: current.size,
+			state: this.state,
+		});
+	}
+
+	/**
+	 * Re-read the registry if the file changed on disk since it was last loaded
+	 */
+	reload(): void {
+		this.loadRegistry();
+	}
+
 	/**
 	 * Add a new epistle to the registry
 	 */
 	addEntry(entry: EpistleRegistryEntry): void {
-		this.entries.set(entry.id, entry);
-		this.saveRegistry();
+		this.setEntry(entry);
+		this.persist([entry]);
+	}
+
+	/**
+	 * Add several epistles with a single write
+	 */
+	addEntries(entries: EpistleRegistryEntry[]): void {
+		for (const entry of entries) {
+			this.setEntry(entry);
+		}
+		this.persist(entries);
 	}
 
 	/**
 	 * Update an existing epistle in the registry
 	 */
 	updateEntry(id: string, updates: Partial<EpistleRegistryEntry>): void {
-		const entry = this.entries.get(id);
+		const entry = this.state.entries.get(id);
 		if (entry) {
-			this.entries.set(id, { ...entry, ...updates });
-			this.saveRegistry();
+			const updated = { ...entry, ...updates };
+			this.setEntry(updated);
+			this.persist([updated]);
 		}
 	}
 
+	/**
+	 * Attach context files to an epistle, skipping any already listed
+	 *
+	 * Returns how many files were actually added (0 if the epistle is unknown).
+	 * A Set makes each membership check O(1) instead of rescanning the list.
+	 */
+	addContext(id: string, files: string[]): number {
+		const entry = this.state.entries.get(id);
+		if (!entry) {
+			return 0;
+		}
+
+		// Lines from disk may hold a non-array context; treat it as empty rather than spreading it
+		const existing = Array.isArray(entry.context) ? entry.context : [];
+		const context = [...existing];
+		const seen = new Set(context);
+		for (const file of files) {
+			if (!seen.has(file)) {
+				context.push(file);
+				seen.add(file);
+			}
+		}
+
+		const added = context.length - existing.length;
+		if (added > 0) {
+			this.updateEntry(id, { context });
+		}
+		return added;
+	}
+
 	/**
 	 * Get a single epistle by ID
+	 *
+	 * Returned entries are frozen (they're shared with other registries); use updateEntry to change one.
 	 */
 	getEntry(id: string): EpistleRegistryEntry | undefined {
-		return this.entries.get(id);
+		return this.state.entries.get(id);
 	}
 
 	/**
 	 * Get all epistles
 	 */
 	getAllEntries(): EpistleRegistryEntry[] {
-		return Array.from(this.entries.values());
+		return Array.from(this.state.entries.values());
+	}
+
+	/**
+	 * Lazily yield epistles matching a predicate
+	 *
+	 * @rhizome: Why a generator?
+	 * getAllEntries().filter() copies every entry into an array just to throw most
+	 * of them away. Iterating the map directly only materializes the matches, and
+	 * callers that want the first hit can stop early.
+	 */
+	*entriesWhere(predicate: (entry: EpistleRegistryEntry) => boolean): Generator<EpistleRegistryEntry> {
+		for (const entry of this.state.entries.values()) {
+			if (predicate(entry)) {
+				yield entry;
+			}
+		}
 	}
 
 	/**
 	 * Get epistles by type
 	 */
 	getEntriesByType(type: 'letter' | 'inline' | 'dynamic_persona'): EpistleRegistryEntry[] {
-		return this.getAllEntries().filter(e => e.type === type);
+		return Array.from(this.entriesWhere(e => e.type === type));
+	}
+
+	/**
+	 * Get epistles newest first, optionally only the most recent `limit`
+	 *
+	 * Dates are read once up front rather than inside the comparator; the sort is
+	 * stable, so epistles from the same day keep their registry order.
+	 */
+	getRecentEntries(limit?: number): EpistleRegistryEntry[] {
+		const keyed = Array.from(this.state.entries.values(), entry => ({ date: entry.date ?? '', entry }));
+		keyed.sort((a, b) => (a.date < b.date ? 1 : a.date > b.date ? -1 : 0));
+		const ranked = limit === undefined ? keyed : keyed.slice(0, Math.max(limit, 0));
+		return ranked.map(key => key.entry);
 	}
 
 	/**
 	 * Get epistles by persona
 	 */
 	getEntriesByPersona(persona: string): EpistleRegistryEntry[] {
-		return this.getAllEntries().filter(e => e.personas.includes(persona));
+		return this.entriesFor(this.searchIndexes().personas.get(persona.toLowerCase())).filter(e =>
+			e.personas.includes(persona)
+		);
 	}
 
 	/**
 	 * Get epistles by date (ISO format)
 	 */
 	getEntriesByDate(date: string): EpistleRegistryEntry[] {
-		return this.getAllEntries().filter(e => e.date === date);
+		return Array.from(this.entriesWhere(e => e.date === date));
 	}
 
 	/**
 	 * Get epistles by flight plan
 	 */
 	getEntriesByFlightPlan(flightPlan: string): EpistleRegistryEntry[] {
-		return this.getAllEntries().filter(e => e.flight_plan === flightPlan);
+		return Array.from(this.entriesWhere(e => e.flight_plan === flightPlan));
 	}
 
 	/**
 	 * Get inline epistles in a specific file
 	 */
 	getInlineEpistlesInFile(filepath: string): EpistleRegistryEntry[] {
-		return this.getAllEntries().filter(
-			e => e.type === 'inline' && e.inline_file === filepath
-		);
+		return this.entriesFor(this.state.inlineFileIndex.get(filepath));
 	}
 
 	/**
@@ -201,9 +835,7 @@ export class EpistleRegistry {
 	 * Get dynamic persona by source file
 	 */
 	getDynamicPersonaForFile(sourceFile: string): EpistleRegistryEntry | undefined {
-		return this.getAllEntries().find(
-			e => e.type === 'dynamic_persona' && e.source_file === sourceFile
-		);
+		return this.entriesFor(this.state.sourceFileIndex.get(sourceFile))[0];
 	}
 
 	/**
@@ -211,12 +843,81 @@ export class EpistleRegistry {
 	 */
 	search(query: string): EpistleRegistryEntry[] {
 		const lowerQuery = query.toLowerCase();
-		return this.getAllEntries().filter(e => {
-			const matchTopic = e.topic?.toLowerCase().includes(lowerQuery);
-			const matchKeywords = e.keywords?.some(k => k.toLowerCase().includes(lowerQuery));
-			const matchContext = e.context?.some(c => c.toLowerCase().includes(lowerQuery));
-			return matchTopic || matchKeywords || matchContext;
-		});
+		const searchText = this.searchIndexes().text;
+		return Array.from(this.entriesWhere(e => {
+			const text = searchText.get(e.id);
+			if (!text) {
+				return false;
+			}
+			const matchTopic = text.topic?.includes(lowerQuery);
+			const matchKeywords = text.keywords.some(k => k.includes(lowerQuery));
+			const matchContext = text.context.some(c => c.includes(lowerQuery));
+			return !!(matchTopic || matchKeywords || matchContext);
+		}));
+	}
+
+	/**
+	 * Find epistles matching every given filter
+	 *
+	 * API only: the sidebar's free-text box matches partial text across topic,
+	 * keywords, and context, which is search(). This is the structured lookup
+	 * for commands and tools that know which field they mean.
+	 *
+	 * @rhizome: Why not filter getAllEntries()?
+	 * That's O(entries × filter values) string work per query. Instead each filter
+	 * becomes a candidate id set from an inverted index; we intersect those and only
+	 * look at survivors. Each topic word is an exact lookup in the token index, and
+	 * survivors are then checked for the whole phrase (word order, adjacency).
+	 */
+	query(filters: EpistleQuery): EpistleRegistryEntry[] {
+		const indexes = this.searchIndexes();
+		const candidateSets: Set<string>[] = [];
+
+		if (filters.personas && filters.personas.length > 0) {
+			candidateSets.push(
+				this.unionOf(indexes.personas, filters.personas.map(p => p.toLowerCase()))
+			);
+		}
+		if (filters.keywords && filters.keywords.length > 0) {
+			candidateSets.push(
+				this.unionOf(indexes.keywords, filters.keywords.map(k => k.toLowerCase()))
+			);
+		}
+
+		const topic = filters.topic?.toLowerCase();
+		if (topic) {
+			for (const word of new Set(tokenize(topic))) {
+				candidateSets.push(indexes.topics.get(word) ?? new Set());
+			}
+		}
+
+		let candidates: Iterable<string> = this.state.entries.keys();
+		if (candidateSets.length > 0) {
+			// Most selective first: walk the smallest set, probe the larger ones
+			candidateSets.sort((a, b) => a.size - b.size);
+			if (candidateSets[0].size === 0) {
+				return [];
+			}
+			const [smallest, ...rest] = candidateSets;
+			candidates = Array.from(smallest).filter(id => rest.every(set => set.has(id)));
+		}
+
+		const results: EpistleRegistryEntry[] = [];
+		for (const id of candidates) {
+			if (topic && !indexes.text.get(id)?.topic?.includes(topic)) {
+				continue;
+			}
+			results.push(this.state.entries.get(id)!);
+		}
+		return results;
+	}
+
+	private unionOf(index: Map<string, Set<string>>, keys: string[]): Set<string> {
+		const union = new Set<string>();
+		for (const key of new Set(keys)) {
+			index.get(key)?.forEach(id => union.add(id));
+		}
+		return union;
 	}
 
 	/**
@@ -228,9 +929,13 @@ export class EpistleRegistry {
 	 * For personas: persona-FILENAME-TIMESTAMP
 	 *
 	 * Always include random suffix for uniqueness even within same millisecond
+	 * Pass `timestamp` when the caller has already read the clock for this epistle.
 	 */
-	generateId(type: 'letter' | 'inline' | 'dynamic_persona', context?: string): string {
-		const timestamp = Date.now();
+	generateId(
+		type: 'letter' | 'inline' | 'dynamic_persona',
+		context?: string,
+		timestamp: number = Date.now()
+	): string {
 		const randomSuffix = Math.random().toString(36).substring(2, 8);
 
 		switch (type) {
@@ -251,6 +956,13 @@ export class EpistleRegistry {
 	getRegistryPath(): string {
 		return this.registryPath;
 	}
+
+	/**
+	 * Get the directory holding letter epistles and the registry
+	 */
+	getEpistlesDir(): string {
+		return this.epistlesDir;
+	}
 }
 
 /**
@@ -182,6 +182,18 @@ describe('Epistle Sidebar Provider', () => {
 			assert.ok(categories.some(c => c.label?.includes('Today')));
 		});
 
+		it('should list each date category newest first', async () => {
+			provider.setFilterMode('date');
+			const categories = await provider.getChildren() as EpistleCategory[];
+
+			const listed = categories.flatMap(c => c.entries.map(e => e.id));
+			assert.strictEqual(listed.length, 4);
+			for (const category of categories) {
+				const dates = category.entries.map(e => e.date);
+				assert.deepStrictEqual(dates, [...dates].sort().reverse());
+			}
+		});
+
 		it('should categorize epistles by flight plan', async () => {
 			provider.setFilterMode('flight-plan');
 			const categories = await provider.getChildren() as EpistleCategory[];
@@ -213,20 +213,21 @@ export class EpistleSidebarProvider {
 	 * Flight plan view: fp-xxx → fp-yyy → Unlinked
 	 */
 	private getRootCategories(): EpistleCategory[] {
-		let entries = this.registry.getAllEntries();
-
-		// Apply search filter
-		if (this.searchQuery.trim()) {
-			entries = this.registry.search(this.searchQuery);
-		}
+		// Apply search filter (search builds its own result; no need to copy everything first)
+		const entries = this.searchQuery.trim()
+			? this.registry.search(this.searchQuery)
+			: this.registry.getAllEntries();
 
 		switch (this.filterMode) {
 			case 'type':
 				return this.categorizeByType(entries);
 			case 'persona':
 				return this.categorizeByPersona(entries);
-			case 'date':
-				return this.categorizeByDate(entries);
+			case 'date': {
+				// Newest first within each bucket
+				const shown = new Set(entries);
+				return this.categorizeByDate(this.registry.getRecentEntries().filter(e => shown.has(e)));
+			}
 			case 'flight-plan':
 				return this.categorizeByFlightPlan(entries);
 		}
@@ -303,9 +304,10 @@ export class EpistleSidebarProvider {
 	}
 
 	private categorizeByDate(entries: EpistleRegistryEntry[]): EpistleCategory[] {
-		const today = new Date().toISOString().split('T')[0];
-		const yesterday = new Date(Date.now() - 86400000).toISOString().split('T')[0];
-		const weekAgo = new Date(Date.now() - 604800000).toISOString().split('T')[0];
+		const now = Date.now();
+		const today = new Date(now).toISOString().split('T')[0];
+		const yesterday = new Date(now - 86400000).toISOString().split('T')[0];
+		const weekAgo = new Date(now - 604800000).toISOString().split('T')[0];
 
 		const today_entries = entries.filter(e => e.date === today);
 		const yesterday_entries = entries.filter(e => e.date === yesterday);